@@ -31,7 +31,9 @@ from .storage import (
     DiscoveryStorageType,
     discovered_device_advertisement_data_from_dict,
     discovered_device_advertisement_data_to_dict,
+    dumps_storage,
     expire_stale_scanner_discovered_device_advertisement_data,
+    loads_storage,
 )
 from .wrappers import HaBleakClientWrapper, HaBleakScannerWrapper
 
@@ -64,7 +66,9 @@ __all__ = [
     "ScannerStartError",
     "discovered_device_advertisement_data_from_dict",
     "discovered_device_advertisement_data_to_dict",
+    "dumps_storage",
     "expire_stale_scanner_discovered_device_advertisement_data",
     "get_manager",
+    "loads_storage",
     "set_manager",
 ]
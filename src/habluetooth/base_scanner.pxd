@@ -4,12 +4,36 @@ import cython
 from .models cimport BluetoothServiceInfoBleak
 from .manager cimport BluetoothManager
 
+cdef object intern
 cdef object parse_advertisement_data_bytes
 cdef object NO_RSSI_VALUE
 cdef object BluetoothServiceInfoBleak
 cdef object AdvertisementData
 cdef object BLEDevice
 cdef bint TYPE_CHECKING
+cdef double SCANNER_WATCHDOG_INTERVAL_SECONDS
+cdef double EXPIRE_DEVICES_INTERVAL_SECONDS
+cdef double SCANNER_WATCHDOG_TIMEOUT
+
+@cython.locals(info=BluetoothServiceInfoBleak)
+cdef BluetoothServiceInfoBleak _make_info(
+    str name,
+    str address,
+    int rssi,
+    dict manufacturer_data,
+    dict service_data,
+    list service_uuids,
+    frozenset service_uuids_set,
+    str source,
+    object device,
+    bint connectable,
+    double time,
+    object tx_power,
+    bytes raw,
+)
+
+@cython.locals(merged=dict, sub_value=bytes, super_value=bytes)
+cdef dict _merge_adv_data(dict prev, dict new)
 
 cdef class BaseHaScanner:
 
@@ -21,7 +45,7 @@ cdef class BaseHaScanner:
     cdef public str name
     cdef public bint scanning
     cdef public double _last_detection
-    cdef public object _start_time
+    cdef public double _start_time
     cdef public object _cancel_watchdog
     cdef public object _loop
     cdef BluetoothManager _manager
@@ -29,6 +53,7 @@ cdef class BaseHaScanner:
     cdef public object current_mode
     cdef public object requested_mode
     cdef public dict _previous_service_info
+    cdef public object _by_time
     cdef public double _expire_seconds
     cdef public dict _details
     cdef public object _cancel_track
@@ -74,6 +99,9 @@ cdef class BaseHaScanner:
     @cython.locals(info=BluetoothServiceInfoBleak)
     cdef dict _build_discovered_device_timestamps(self)
 
+    @cython.locals(info=BluetoothServiceInfoBleak)
+    cdef dict _build_discovered_device_raw(self)
+
     @cython.locals(parsed=tuple)
     cpdef void _async_on_raw_advertisement(
         self,
@@ -85,14 +113,15 @@ cdef class BaseHaScanner:
     )
 
     @cython.locals(
+        name=str,
         prev_name=str,
         prev_discovery=tuple,
         has_local_name=bint,
-        has_manufacturer_data=bint,
-        has_service_data=bint,
         has_service_uuids=bint,
-        sub_value=bytes,
-        super_value=bytes,
+        prev_uuids_set=frozenset,
+        new_uuids_set=frozenset,
+        uuids_set=frozenset,
+        merged_details=dict,
         info=BluetoothServiceInfoBleak,
         prev_info=BluetoothServiceInfoBleak
     )
@@ -123,7 +152,7 @@ cdef class BaseHaScanner:
         double advertisement_monotonic_time
     )
 
-    @cython.locals(now=double, timestamp=double, info=BluetoothServiceInfoBleak)
+    @cython.locals(now=double, timestamp=double, expire_seconds=double, expired=list)
     cpdef void _async_expire_devices(self)
 
     cpdef void _schedule_expire_devices(self)
@@ -5,8 +5,12 @@ from __future__ import annotations
 import asyncio
 import logging
 import warnings
+from collections import OrderedDict
 from collections.abc import Generator, Iterable
 from contextlib import contextmanager
+from functools import lru_cache
+from operator import itemgetter
+from sys import intern
 from typing import TYPE_CHECKING, Any, Final, final
 
 from bleak.backends.device import BLEDevice
@@ -32,6 +36,7 @@ from .scanner_device import BluetoothScannerDevice
 from .storage import DiscoveredDeviceAdvertisementData
 
 SCANNER_WATCHDOG_INTERVAL_SECONDS: Final = SCANNER_WATCHDOG_INTERVAL.total_seconds()
+EXPIRE_DEVICES_INTERVAL_SECONDS: Final = 30.0
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -41,10 +46,75 @@ _int = int
 _str = str
 
 
+@lru_cache(maxsize=64)
+def _cached_adapter_human_name(adapter: str, source: str) -> str:
+    """Return the human readable adapter name, cached by (adapter, source)."""
+    return adapter_human_name(adapter, source)
+
+
+def _make_info(
+    name: _str,
+    address: _str,
+    rssi: _int,
+    manufacturer_data: dict[int, bytes],
+    service_data: dict[str, bytes],
+    service_uuids: list[str],
+    service_uuids_set: frozenset[str] | None,
+    source: _str,
+    device: BLEDevice,
+    connectable: bool,
+    time: _float,
+    tx_power: _int | None,
+    raw: _bytes | None,
+) -> BluetoothServiceInfoBleak:
+    """Construct a BluetoothServiceInfoBleak without running __init__."""
+    info = BluetoothServiceInfoBleak.__new__(BluetoothServiceInfoBleak)
+    info.name = name
+    info.address = address
+    info.rssi = rssi
+    info.manufacturer_data = manufacturer_data
+    info.service_data = service_data
+    info.service_uuids = service_uuids
+    info._service_uuids_set = service_uuids_set
+    info.source = source
+    info.device = device
+    info._advertisement = None
+    info.connectable = connectable
+    info.time = time
+    info.tx_power = tx_power
+    info.raw = raw
+    return info
+
+
+def _merge_adv_data(prev: dict[Any, bytes], new: dict[Any, bytes]) -> dict[Any, bytes]:
+    """
+    Merge new advertisement data into the previous data.
+
+    Returns the previous dict unchanged when the new data adds
+    nothing so callers can keep sharing it; otherwise a merged
+    copy. Neither input is mutated.
+    """
+    if not new or new is prev:
+        return prev
+    if len(new) > len(prev):
+        # More keys than the previous data so it cannot be
+        # a subset; skip the probe loop and merge directly
+        merged = prev.copy()
+        merged.update(new)
+        return merged
+    for key, sub_value in new.items():
+        if (super_value := prev.get(key)) is None or super_value != sub_value:
+            merged = prev.copy()
+            merged.update(new)
+            return merged
+    return prev
+
+
 class BaseHaScanner:
     """Base class for high availability BLE scanners."""
 
     __slots__ = (
+        "_by_time",
         "_cancel_track",
         "_cancel_watchdog",
         "_connect_failures",
@@ -83,7 +153,9 @@ class BaseHaScanner:
         self.connector = connector
         self._connecting = 0
         self.adapter = adapter
-        self.name = adapter_human_name(adapter, source) if adapter != source else source
+        self.name = (
+            _cached_adapter_human_name(adapter, source) if adapter != source else source
+        )
         self.scanning: bool = True
         self.requested_mode = requested_mode
         self.current_mode = current_mode
@@ -99,6 +171,9 @@ class BaseHaScanner:
             adapter=self.adapter,
         )
         self._previous_service_info: dict[str, BluetoothServiceInfoBleak] = {}
+        # Secondary index ordered by last detection time so expiration
+        # only has to look at the oldest entries instead of every device
+        self._by_time: OrderedDict[str, float] = OrderedDict()
         # Scanners only care about connectable devices. The manager
         # will handle taking care of availability for non-connectable devices
         self._expire_seconds = CONNECTABLE_FALLBACK_MAXIMUM_STALE_ADVERTISEMENT_SECONDS
@@ -211,8 +286,8 @@ class BaseHaScanner:
         loop = self._loop
         if TYPE_CHECKING:
             assert loop is not None
-        self._cancel_watchdog = loop.call_at(
-            loop.time() + SCANNER_WATCHDOG_INTERVAL_SECONDS,
+        self._cancel_watchdog = loop.call_later(
+            SCANNER_WATCHDOG_INTERVAL_SECONDS,
             self._async_call_scanner_watchdog,
         )
 
@@ -239,14 +314,23 @@ class BaseHaScanner:
         Override this method if you need to do something else when the watchdog
         is triggered.
         """
-        if self._async_watchdog_triggered():
+        # Read the clock once per tick and reuse the value instead of
+        # calling monotonic_time_coarse() for the check and again for
+        # the log message.
+        time_since_last_detection = self.time_since_last_detection()
+        _LOGGER.debug(
+            "%s: Scanner watchdog time_since_last_detection: %s",
+            self.name,
+            time_since_last_detection,
+        )
+        if time_since_last_detection > SCANNER_WATCHDOG_TIMEOUT:
             _LOGGER.debug(
                 (
                     "%s: Bluetooth scanner has gone quiet for %ss, check logs on the"
                     " scanner device for more information"
                 ),
                 self.name,
-                self.time_since_last_detection(),
+                time_since_last_detection,
             )
             self.scanning = False
             return
@@ -290,9 +374,15 @@ class BaseHaScanner:
         """Return the advertisement data for a discovered device."""
         raise NotImplementedError
 
+    def _diagnostics_device_advertisement_datas(
+        self,
+    ) -> Iterable[tuple[BLEDevice, AdvertisementData]]:
+        """Return the (device, advertisement_data) pairs for diagnostics."""
+        return self.discovered_devices_and_advertisement_data.values()
+
     async def async_diagnostics(self) -> dict[str, Any]:
         """Return diagnostic information about the scanner."""
-        device_adv_datas = self.discovered_devices_and_advertisement_data.values()
+        device_adv_datas = self._diagnostics_device_advertisement_datas()
         return {
             "name": self.name,
             "connectable": self.connectable,
@@ -342,6 +432,15 @@ class BaseHaScanner:
                 adv,
             ) in history.discovered_device_advertisement_datas.items()
         }
+        self._by_time = OrderedDict(
+            sorted(
+                (
+                    (address, info.time)
+                    for address, info in self._previous_service_info.items()
+                ),
+                key=itemgetter(1),
+            )
+        )
         # Expire anything that is too old
         self._async_expire_devices()
 
@@ -456,29 +555,45 @@ class BaseHaScanner:
         raw: _bytes | None,
     ) -> None:
         """Call the registered callback."""
-        self.scanning = not self._connecting
+        # Addresses are short stable strings that repeat for every
+        # advertisement from the same device; interning them makes the
+        # dict lookups below identity-compare fast-path hits. Growth of
+        # the intern table is bounded by the number of unique devices.
+        address = intern(address)
+        if not self.scanning and not self._connecting:
+            # A detection means the scanner is alive again after the
+            # watchdog marked it quiet; only write the flag when it
+            # actually changes so the common case is a read, not a store
+            self.scanning = True
         self._last_detection = advertisement_monotonic_time
-        info = BluetoothServiceInfoBleak.__new__(BluetoothServiceInfoBleak)
 
-        if (prev_info := self._previous_service_info.get(address)) is None:
-            # We expect this is the rare case and since py3.11+ has
-            # near zero cost try on success, and we can avoid .get()
-            # which is slower than [] we use the try/except pattern.
-            info.device = BLEDevice(
+        # A new device is the rare case and since py3.11+ has
+        # near zero cost try on success, and we can avoid .get()
+        # which is slower than [] we use the try/except pattern.
+        try:
+            prev_info = self._previous_service_info[address]
+        except KeyError:
+            if details:
+                merged_details = self._details.copy()
+                merged_details.update(details)
+            else:
+                # No per-device details so the constant per-scanner
+                # details can be shared instead of copied; nothing
+                # mutates BLEDevice.details after construction
+                merged_details = self._details
+            device = BLEDevice(
                 address,
                 local_name,
-                {**self._details, **details},
+                merged_details,
             )
-            info.manufacturer_data = manufacturer_data
-            info.service_data = service_data
-            info.service_uuids = service_uuids
-            info.name = local_name or address
+            name = local_name or address
+            uuids_set = None
         else:
             # Merge the new data with the old data
             # to function the same as BlueZ which
             # merges the dicts on PropertiesChanged
-            info.device = prev_info.device
-            prev_name = prev_info.device.name
+            device = prev_info.device
+            prev_name = device.name
             #
             # Bleak updates the BLEDevice via create_or_update_device.
             # We need to do the same to ensure integrations that already
@@ -491,10 +606,10 @@ class BaseHaScanner:
                 or not local_name
                 or len(prev_name) > len(local_name)
             ):
-                info.name = prev_name
+                name = prev_name
             else:
-                info.device.name = local_name
-                info.name = local_name if local_name else address
+                device.name = local_name
+                name = local_name or address
 
             has_service_uuids = bool(service_uuids)
             if (
@@ -502,71 +617,68 @@ class BaseHaScanner:
                 and service_uuids is not prev_info.service_uuids
                 and service_uuids != prev_info.service_uuids
             ):
-                info.service_uuids = list({*service_uuids, *prev_info.service_uuids})
-            elif not has_service_uuids:
-                info.service_uuids = prev_info.service_uuids
-            else:
-                info.service_uuids = service_uuids
-
-            has_service_data = bool(service_data)
-            if has_service_data and service_data is not prev_info.service_data:
-                for uuid, sub_value in service_data.items():
-                    if (
-                        super_value := prev_info.service_data.get(uuid)
-                    ) is None or super_value != sub_value:
-                        info.service_data = {
-                            **prev_info.service_data,
-                            **service_data,
-                        }
-                        break
+                if (prev_uuids_set := prev_info._service_uuids_set) is None:
+                    prev_uuids_set = frozenset(prev_info.service_uuids)
+                new_uuids_set = frozenset(service_uuids)
+                if new_uuids_set <= prev_uuids_set:
+                    # Nothing new; reuse the previous list and cached set
+                    service_uuids = prev_info.service_uuids
+                    uuids_set = prev_uuids_set
                 else:
-                    info.service_data = prev_info.service_data
-            elif not has_service_data:
-                info.service_data = prev_info.service_data
+                    # Append only the genuinely new UUIDs so the previous
+                    # list order is preserved instead of rebuilding the
+                    # list from an unordered set union
+                    service_uuids = prev_info.service_uuids + [
+                        uuid for uuid in service_uuids if uuid not in prev_uuids_set
+                    ]
+                    uuids_set = prev_uuids_set | new_uuids_set
+            elif not has_service_uuids:
+                service_uuids = prev_info.service_uuids
+                uuids_set = prev_info._service_uuids_set
             else:
-                info.service_data = service_data
+                # Unchanged UUIDs so the previous cached set still applies
+                uuids_set = prev_info._service_uuids_set
 
-            has_manufacturer_data = bool(manufacturer_data)
-            if (
-                has_manufacturer_data
-                and manufacturer_data is not prev_info.manufacturer_data
-            ):
-                for id_, sub_value in manufacturer_data.items():
-                    if (
-                        super_value := prev_info.manufacturer_data.get(id_)
-                    ) is None or super_value != sub_value:
-                        info.manufacturer_data = {
-                            **prev_info.manufacturer_data,
-                            **manufacturer_data,
-                        }
-                        break
-                else:
-                    info.manufacturer_data = prev_info.manufacturer_data
-            elif not has_manufacturer_data:
-                info.manufacturer_data = prev_info.manufacturer_data
-            else:
-                info.manufacturer_data = manufacturer_data
-
-        info.address = address
-        info.rssi = rssi
-        info.source = self.source
-        info._advertisement = None
-        info.connectable = self.connectable
-        info.time = advertisement_monotonic_time
-        info.tx_power = tx_power
-        info.raw = raw
+            service_data = _merge_adv_data(prev_info.service_data, service_data)
+            manufacturer_data = _merge_adv_data(
+                prev_info.manufacturer_data, manufacturer_data
+            )
+
+        info = _make_info(
+            name,
+            address,
+            rssi,
+            manufacturer_data,
+            service_data,
+            service_uuids,
+            uuids_set,
+            self.source,
+            device,
+            self.connectable,
+            advertisement_monotonic_time,
+            tx_power,
+            raw,
+        )
         self._previous_service_info[address] = info
+        by_time = self._by_time
+        by_time[address] = advertisement_monotonic_time
+        by_time.move_to_end(address)
         self._manager.scanner_adv_received(info)
 
     def _async_expire_devices(self) -> None:
         """Expire old devices."""
         now = monotonic_time_coarse()
-        expired = [
-            address
-            for address, info in self._previous_service_info.items()
-            if now - info.time > self._expire_seconds
-        ]
+        expire_seconds = self._expire_seconds
+        by_time = self._by_time
+        expired: list[str] = []
+        for address, timestamp in by_time.items():
+            if now - timestamp <= expire_seconds:
+                # Entries are ordered by last detection time so
+                # everything after this one is even newer
+                break
+            expired.append(address)
         for address in expired:
+            del by_time[address]
             del self._previous_service_info[address]
 
     def _cancel_expire_devices(self) -> None:
@@ -581,14 +693,21 @@ class BaseHaScanner:
         if TYPE_CHECKING:
             assert loop is not None
         self._cancel_expire_devices()
-        self._cancel_track = loop.call_at(
-            loop.time() + 30, self._async_expire_devices_schedule_next
+        self._cancel_track = loop.call_later(
+            EXPIRE_DEVICES_INTERVAL_SECONDS, self._async_expire_devices_schedule_next
         )
 
     def _async_expire_devices_schedule_next(self) -> None:
         """Expire old devices and schedule the next expiration."""
+        loop = self._loop
+        if TYPE_CHECKING:
+            assert loop is not None
         self._async_expire_devices()
-        self._schedule_expire_devices()
+        # The handle that called us has already fired so there is
+        # nothing to cancel; install the next timer directly.
+        self._cancel_track = loop.call_later(
+            EXPIRE_DEVICES_INTERVAL_SECONDS, self._async_expire_devices_schedule_next
+        )
 
 
 class BaseHaRemoteScanner(BaseHaScanner):
@@ -623,6 +742,18 @@ class BaseHaRemoteScanner(BaseHaScanner):
         """Return an iterable of discovered devices."""
         return self._previous_service_info
 
+    def _diagnostics_device_advertisement_datas(
+        self,
+    ) -> Iterable[tuple[BLEDevice, AdvertisementData]]:
+        """Return the (device, advertisement_data) pairs for diagnostics."""
+        # Skip the intermediate address-keyed dict that
+        # discovered_devices_and_advertisement_data would build since
+        # diagnostics only needs the pairs
+        return [
+            (info.device, info._advertisement_internal())
+            for info in self._previous_service_info.values()
+        ]
+
     def get_discovered_device_advertisement_data(
         self, address: str
     ) -> tuple[BLEDevice, AdvertisementData] | None:
@@ -634,15 +765,21 @@ class BaseHaRemoteScanner(BaseHaScanner):
     async def async_diagnostics(self) -> dict[str, Any]:
         """Return diagnostic information about the scanner."""
         now = monotonic_time_coarse()
-        discovered_device_timestamps = self._build_discovered_device_timestamps()
-        return await super().async_diagnostics() | {
-            "discovered_device_timestamps": discovered_device_timestamps,
-            "raw_advertisement_data": {
-                address: info.raw
-                for address, info in self._previous_service_info.items()
-            },
-            "time_since_last_device_detection": {
-                address: now - timestamp
-                for address, timestamp in discovered_device_timestamps.items()
-            },
-        }
+        # Build all three per-device dicts in a single pass over
+        # _previous_service_info instead of walking it once per dict
+        discovered_device_timestamps: dict[str, float] = {}
+        raw_advertisement_data: dict[str, bytes | None] = {}
+        time_since_last_device_detection: dict[str, float] = {}
+        for address, info in self._previous_service_info.items():
+            discovered_device_timestamps[address] = info.time
+            raw_advertisement_data[address] = info.raw
+            time_since_last_device_detection[address] = now - info.time
+        diagnostics = await super().async_diagnostics()
+        # Update in place instead of merging with | which would
+        # allocate and rehash a third dict
+        diagnostics["discovered_device_timestamps"] = discovered_device_timestamps
+        diagnostics["raw_advertisement_data"] = raw_advertisement_data
+        diagnostics["time_since_last_device_detection"] = (
+            time_since_last_device_detection
+        )
+        return diagnostics
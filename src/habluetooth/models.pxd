@@ -29,6 +29,7 @@ cdef class BluetoothServiceInfoBleak(BluetoothServiceInfo):
 
     cdef public object device
     cdef public object _advertisement
+    cdef public frozenset _service_uuids_set
     cdef public bint connectable
     cdef public double time
     cdef public object tx_power
@@ -163,7 +163,15 @@ class BluetoothServiceInfoBleak(BluetoothServiceInfo):
     internal details.
     """
 
-    __slots__ = ("_advertisement", "connectable", "device", "raw", "time", "tx_power")
+    __slots__ = (
+        "_advertisement",
+        "_service_uuids_set",
+        "connectable",
+        "device",
+        "raw",
+        "time",
+        "tx_power",
+    )
 
     def __init__(
         self,
@@ -187,6 +195,9 @@ class BluetoothServiceInfoBleak(BluetoothServiceInfo):
         self.manufacturer_data = manufacturer_data
         self.service_data = service_data
         self.service_uuids = service_uuids
+        # Lazily built frozenset of service_uuids used to cheaply
+        # detect unchanged UUIDs in the advertisement merge path
+        self._service_uuids_set: frozenset[str] | None = None
         self.source = source
         self.device = device
         self._advertisement = advertisement
@@ -320,6 +331,7 @@ class BluetoothServiceInfoBleak(BluetoothServiceInfo):
         new_obj.manufacturer_data = self.manufacturer_data
         new_obj.service_data = self.service_data
         new_obj.service_uuids = self.service_uuids
+        new_obj._service_uuids_set = self._service_uuids_set
         new_obj.source = self.source
         new_obj.device = self.device
         new_obj._advertisement = self._advertisement
@@ -316,6 +316,7 @@ class HaScanner(BaseHaScanner):
         service_info.manufacturer_data = manufacturer_data
         service_info.service_data = service_data
         service_info.service_uuids = service_uuids
+        service_info._service_uuids_set = None
         service_info.source = self.source
         service_info.device = device
         service_info._advertisement = advertisement_data
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from bleak.backends.device import BLEDevice
@@ -19,7 +20,14 @@ class BluetoothScannerDevice:
     scanner: BaseHaScanner
     ble_device: BLEDevice
     advertisement: AdvertisementData
+    _score: Callable[[int, BluetoothScannerDevice], float] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Cache the bound scoring method for repeated scoring calls."""
+        self._score = self.scanner._score_connection_paths
 
     def score_connection_path(self, rssi_diff: int) -> float:
         """Return a score for the connection path to this device."""
-        return self.scanner._score_connection_paths(rssi_diff, self)
+        return self._score(rssi_diff, self)
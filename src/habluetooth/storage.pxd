@@ -0,0 +1,39 @@
+import cython
+
+cdef object BLEDevice
+cdef object AdvertisementData
+cdef object a2b_base64
+cdef object b2a_base64
+cdef object time
+cdef object BLE_DEVICE_NEW
+
+cdef str _encode_bytes(bytes value)
+
+@cython.locals(device_dict=dict, advertisement_data=dict)
+cdef tuple _discovered_device_from_dict(
+    dict device_advertisement_data,
+    object decode_bytes
+)
+
+@cython.locals(manufacturer_datas=dict, service_datas=dict)
+cdef dict _discovered_device_to_dict(
+    object ble_device,
+    object advertisement_data
+)
+
+@cython.locals(out_advs=dict, out_timestamps=dict, out_raws=dict, time_diff=double)
+cdef tuple _serialize_per_scanner(
+    dict discovered_device_advertisement_datas,
+    dict discovered_device_timestamps,
+    dict discovered_device_raw
+)
+
+@cython.locals(out_advs=dict, out_timestamps=dict, out_raws=dict, time_diff=double)
+cdef tuple _deserialize_per_scanner(
+    dict discovered_device_advertisement_datas,
+    dict discovered_device_timestamps,
+    dict discovered_device_raw,
+    object decode_bytes
+)
+
+cdef list _MONOTONIC_TIME_DIFF_CACHE
@@ -2,14 +2,25 @@
 
 from __future__ import annotations
 
+import json
 import logging
 import time
+from binascii import a2b_base64, b2a_base64
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from typing import Any, Final, TypedDict
+from functools import lru_cache
+from typing import Any, Final, NotRequired, TypedDict
 
 from bleak.backends.device import BLEDevice
 from bleak.backends.scanner import AdvertisementData
 
+try:
+    import orjson
+
+    HAS_ORJSON: bool = True
+except ImportError:  # pragma: no cover - orjson is optional
+    HAS_ORJSON = False
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -31,11 +42,17 @@ EXPIRE_SECONDS: Final = "expire_seconds"
 DISCOVERED_DEVICE_ADVERTISEMENT_DATAS: Final = "discovered_device_advertisement_datas"
 DISCOVERED_DEVICE_TIMESTAMPS: Final = "discovered_device_timestamps"
 DISCOVERED_DEVICE_RAW: Final = "discovered_device_raw"
+VERSION: Final = "version"
+
+# Version 1 (no version key) stored binary blobs as hex; version 2
+# stores them as base64 which is ~2x smaller and decodes faster
+STORAGE_VERSION: Final = 2
 
 
 class DiscoveredDeviceAdvertisementDataDict(TypedDict):
     """Discovered device advertisement data dict in storage."""
 
+    version: NotRequired[int]
     connectable: bool
     expire_seconds: float
     discovered_device_advertisement_datas: dict[str, DiscoveredDeviceDict]
@@ -78,6 +95,10 @@ class AdvertisementDataDict(TypedDict):
     platform_data: list[Any]
 
 
+DEVICE: Final = "device"
+ADVERTISEMENT_DATA: Final = "advertisement_data"
+
+
 class DiscoveredDeviceDict(TypedDict):
     """Discovered device dict."""
 
@@ -92,18 +113,36 @@ def expire_stale_scanner_discovered_device_advertisement_data(
     now = time.time()
     expired_scanners: list[str] = []
     for scanner, data in data_by_scanner.items():
-        expire: list[str] = []
         expire_seconds = data[EXPIRE_SECONDS]
         timestamps = data[DISCOVERED_DEVICE_TIMESTAMPS]
         discovered_device_advertisement_datas = data[
             DISCOVERED_DEVICE_ADVERTISEMENT_DATAS
         ]
         discovered_device_raw = data.get(DISCOVERED_DEVICE_RAW, {})
-        for address, timestamp in timestamps.items():
-            time_diff = now - timestamp
-            if time_diff > expire_seconds:
-                expire.append(address)
-            elif time_diff < 0:
+        threshold = now - expire_seconds
+        if timestamps:
+            values = timestamps.values()
+            if min(values) >= threshold and max(values) <= now:
+                # The oldest entry is still fresh and nothing is in the
+                # future, so there is nothing to expire for this scanner;
+                # the C-level min/max prepass avoids the per-address scan
+                _LOGGER.debug(
+                    "Loaded %s fresh discovered devices for %s",
+                    len(timestamps),
+                    scanner,
+                )
+                continue
+        # Select everything to expire in one bulk pass with the
+        # threshold hoisted out of the loop; only the (rare) future
+        # timestamps need a second look to emit the warning
+        expire = [
+            address
+            for address, timestamp in timestamps.items()
+            if timestamp < threshold or timestamp > now
+        ]
+        for address in expire:
+            timestamp = timestamps[address]
+            if timestamp > now:
                 _LOGGER.warning(
                     "Discarding timestamp %s for %s on "
                     "scanner %s as it is the future (now = %s)",
@@ -112,11 +151,36 @@ def expire_stale_scanner_discovered_device_advertisement_data(
                     scanner,
                     now,
                 )
-                expire.append(address)
-        for address in expire:
-            del timestamps[address]
-            del discovered_device_advertisement_datas[address]
-            discovered_device_raw.pop(address, None)
+        if len(expire) > len(timestamps) // 2:
+            # Most entries are stale; rebuilding leaves compact dicts
+            # instead of sparse ones since dicts do not shrink on del
+            expire_set = set(expire)
+            timestamps = {
+                address: timestamp
+                for address, timestamp in timestamps.items()
+                if address not in expire_set
+            }
+            data[DISCOVERED_DEVICE_TIMESTAMPS] = timestamps
+            data[DISCOVERED_DEVICE_ADVERTISEMENT_DATAS] = {
+                address: discovered_device
+                for address, discovered_device in (
+                    discovered_device_advertisement_datas.items()
+                )
+                if address not in expire_set
+            }
+            if discovered_device_raw:
+                data[DISCOVERED_DEVICE_RAW] = {
+                    address: raw
+                    for address, raw in discovered_device_raw.items()
+                    if address not in expire_set
+                }
+        else:
+            for address in expire:
+                del timestamps[address]
+                # Files written before dangling addresses were pruned on
+                # load may carry a timestamp without an advertisement
+                discovered_device_advertisement_datas.pop(address, None)
+                discovered_device_raw.pop(address, None)
         if not timestamps:
             expired_scanners.append(scanner)
         _LOGGER.debug(
@@ -132,16 +196,26 @@ def discovered_device_advertisement_data_from_dict(
 ) -> DiscoveredDeviceAdvertisementData | None:
     """Build discovered_device_advertisement_data dict."""
     try:
+        # Version 1 dicts predate the version key and stored blobs as hex
+        decode_bytes = (
+            _cached_a2b_base64 if data.get(VERSION, 1) >= 2 else _cached_bytes_fromhex
+        )
+        (
+            discovered_device_advertisement_datas,
+            discovered_device_timestamps,
+            discovered_device_raw,
+        ) = _deserialize_per_scanner(
+            data[DISCOVERED_DEVICE_ADVERTISEMENT_DATAS],
+            data[DISCOVERED_DEVICE_TIMESTAMPS],
+            data.get(DISCOVERED_DEVICE_RAW, {}),
+            decode_bytes,
+        )
         return DiscoveredDeviceAdvertisementData(
             data[CONNECTABLE],
             data[EXPIRE_SECONDS],
-            _deserialize_discovered_device_advertisement_datas(
-                data[DISCOVERED_DEVICE_ADVERTISEMENT_DATAS]
-            ),
-            _deserialize_discovered_device_timestamps(
-                data[DISCOVERED_DEVICE_TIMESTAMPS]
-            ),
-            _deserialize_discovered_device_raw(data.get(DISCOVERED_DEVICE_RAW, {})),
+            discovered_device_advertisement_datas,
+            discovered_device_timestamps,
+            discovered_device_raw,
         )
     except Exception as err:  # pylint: disable=broad-except
         _LOGGER.exception(
@@ -156,166 +230,322 @@ def discovered_device_advertisement_data_to_dict(
     data: DiscoveredDeviceAdvertisementData,
 ) -> DiscoveredDeviceAdvertisementDataDict:
     """Build discovered_device_advertisement_data dict."""
-    return DiscoveredDeviceAdvertisementDataDict(
-        connectable=data.connectable,
-        expire_seconds=data.expire_seconds,
-        discovered_device_advertisement_datas=_serialize_discovered_device_advertisement_datas(
-            data.discovered_device_advertisement_datas
-        ),
-        discovered_device_timestamps=_serialize_discovered_device_timestamps(
-            data.discovered_device_timestamps
-        ),
-        discovered_device_raw=_serialize_discovered_device_raw(
-            data.discovered_device_raw
-        ),
+    (
+        discovered_device_advertisement_datas,
+        discovered_device_timestamps,
+        discovered_device_raw,
+    ) = _serialize_per_scanner(
+        data.discovered_device_advertisement_datas,
+        data.discovered_device_timestamps,
+        data.discovered_device_raw,
     )
-
-
-def _serialize_discovered_device_advertisement_datas(
-    discovered_device_advertisement_datas: dict[
-        str, tuple[BLEDevice, AdvertisementData]
-    ],
-) -> dict[str, DiscoveredDeviceDict]:
-    """Serialize discovered_device_advertisement_datas."""
+    # A dict literal is a single BUILD_MAP; calling the TypedDict
+    # would pack kwargs into one dict only to copy them into another
     return {
-        address: DiscoveredDeviceDict(
-            device=_ble_device_to_dict(device, advertisement_data),
-            advertisement_data=_advertisement_data_to_dict(advertisement_data),
-        )
-        for (
-            address,
-            (device, advertisement_data),
-        ) in discovered_device_advertisement_datas.items()
+        VERSION: STORAGE_VERSION,
+        CONNECTABLE: data.connectable,
+        EXPIRE_SECONDS: data.expire_seconds,
+        DISCOVERED_DEVICE_ADVERTISEMENT_DATAS: discovered_device_advertisement_datas,
+        DISCOVERED_DEVICE_TIMESTAMPS: discovered_device_timestamps,
+        DISCOVERED_DEVICE_RAW: discovered_device_raw,
     }
 
 
-def _deserialize_discovered_device_advertisement_datas(
-    discovered_device_advertisement_datas: dict[str, DiscoveredDeviceDict],
-) -> dict[str, tuple[BLEDevice, AdvertisementData]]:
-    """Deserialize discovered_device_advertisement_datas."""
-    return {
-        address: (
-            _ble_device_from_dict(device_advertisement_data["device"]),
-            _advertisement_data_from_dict(
-                device_advertisement_data["advertisement_data"]
-            ),
-        )
-        for (
-            address,
-            device_advertisement_data,
-        ) in discovered_device_advertisement_datas.items()
-    }
+def dumps_storage(data: DiscoveredDeviceAdvertisementData) -> bytes:
+    """
+    Serialize discovered device advertisement data to JSON bytes.
 
+    Encodes with orjson when it is installed, falling back to the
+    stdlib json module.
+    """
+    as_dict = discovered_device_advertisement_data_to_dict(data)
+    if HAS_ORJSON:
+        return orjson.dumps(as_dict)
+    return json.dumps(as_dict, separators=(",", ":")).encode("utf-8")
 
-def _ble_device_from_dict(device_dict: BLEDeviceDict) -> BLEDevice:
-    """Deserialize BLEDevice from dict, handling backward compatibility."""
-    # Remove rssi from dict as BLEDevice no longer accepts it in bleak 1.x
-    device_data = device_dict.copy()
-    device_data.pop("rssi", None)  # type: ignore[misc]  # Remove rssi if present (backward compatibility)
-    return BLEDevice(**device_data)
 
+def loads_storage(data: bytes | str) -> DiscoveredDeviceAdvertisementData | None:
+    """
+    Deserialize discovered device advertisement data from JSON.
 
-def _ble_device_to_dict(
-    ble_device: BLEDevice, advertisement_data: AdvertisementData
-) -> BLEDeviceDict:
-    """Serialize ble_device."""
-    return BLEDeviceDict(
-        address=ble_device.address,
-        name=ble_device.name,
-        rssi=advertisement_data.rssi,  # For backward compatibility
-        details=ble_device.details,
-    )
+    Returns None when the payload cannot be decoded.
+    """
+    try:
+        # Both JSONDecodeErrors are ValueError subclasses
+        as_dict = orjson.loads(data) if HAS_ORJSON else json.loads(data)
+    except ValueError as err:
+        _LOGGER.exception(
+            "Error parsing discovered_device_advertisement_data"
+            ", adapter startup will be slow: %s",
+            err,
+        )
+        return None
+    return discovered_device_advertisement_data_from_dict(as_dict)
 
 
-def _advertisement_data_from_dict(
-    advertisement_data: AdvertisementDataDict,
-) -> AdvertisementData:
-    """Deserialize advertisement_data."""
-    return AdvertisementData(
-        local_name=advertisement_data[LOCAL_NAME],
-        manufacturer_data={
-            int(manufacturer_id): bytes.fromhex(manufacturer_data)
-            for manufacturer_id, manufacturer_data in advertisement_data[
-                MANUFACTURER_DATA
-            ].items()
-        },
-        service_data={
-            service_uuid: bytes.fromhex(service_data)
-            for service_uuid, service_data in advertisement_data[SERVICE_DATA].items()
-        },
-        service_uuids=advertisement_data[SERVICE_UUIDS],
-        rssi=advertisement_data[RSSI],
-        tx_power=advertisement_data[TX_POWER],
-        platform_data=tuple(advertisement_data[PLATFORM_DATA]),
+def _serialize_per_scanner(
+    discovered_device_advertisement_datas: dict[
+        str, tuple[BLEDevice, AdvertisementData]
+    ],
+    discovered_device_timestamps: dict[str, float],
+    discovered_device_raw: dict[str, bytes | None],
+) -> tuple[dict[str, DiscoveredDeviceDict], dict[str, float], dict[str, str | None]]:
+    """
+    Serialize the three per-scanner dicts in one pass.
+
+    The timestamp and raw dicts are keyed by the same addresses as the
+    advertisement dict, so one walk fills all three outputs.
+    """
+    out_advs: dict[str, DiscoveredDeviceDict] = {}
+    out_timestamps: dict[str, float] = {}
+    out_raws: dict[str, str | None] = {}
+    time_diff = _get_monotonic_time_diff() if discovered_device_timestamps else 0.0
+    for address, (
+        device,
+        advertisement_data,
+    ) in discovered_device_advertisement_datas.items():
+        out_advs[address] = _discovered_device_to_dict(device, advertisement_data)
+        if (timestamp := discovered_device_timestamps.get(address)) is not None:
+            out_timestamps[address] = timestamp + time_diff
+        if address in discovered_device_raw:
+            raw = discovered_device_raw[address]
+            out_raws[address] = None if raw is None else _encode_bytes(raw)
+    # Addresses present only in the timestamp or raw dicts are not
+    # expected, but keep them rather than silently dropping data
+    if len(out_timestamps) != len(discovered_device_timestamps):
+        for address, timestamp in discovered_device_timestamps.items():
+            if address not in out_timestamps:
+                out_timestamps[address] = timestamp + time_diff
+    if len(out_raws) != len(discovered_device_raw):
+        for address, raw in discovered_device_raw.items():
+            if address not in out_raws:
+                out_raws[address] = None if raw is None else _encode_bytes(raw)
+    return out_advs, out_timestamps, out_raws
+
+
+def _deserialize_per_scanner(
+    discovered_device_advertisement_datas: dict[str, DiscoveredDeviceDict],
+    discovered_device_timestamps: dict[str, float],
+    discovered_device_raw: dict[str, str | None],
+    decode_bytes: Callable[[str], bytes],
+) -> tuple[
+    dict[str, tuple[BLEDevice, AdvertisementData]],
+    dict[str, float],
+    dict[str, bytes | None],
+]:
+    """Deserialize the three per-scanner dicts in one pass."""
+    out_advs: dict[str, tuple[BLEDevice, AdvertisementData]] = {}
+    out_timestamps: dict[str, float] = {}
+    out_raws: dict[str, bytes | None] = {}
+    time_diff = _get_monotonic_time_diff() if discovered_device_timestamps else 0.0
+    for (
+        address,
+        device_advertisement_data,
+    ) in discovered_device_advertisement_datas.items():
+        try:
+            out_advs[address] = _discovered_device_from_dict(
+                device_advertisement_data, decode_bytes
+            )
+        except (KeyError, ValueError, TypeError) as err:
+            # One corrupt entry should not throw away the rest of the
+            # scanner's cache; skip it along with its timestamp and raw
+            # data so the dangling address cannot round-trip to disk
+            _LOGGER.exception(
+                "Error deserializing discovered device %s, dropping it: %s",
+                address,
+                err,
+            )
+            continue
+        if (unix_time := discovered_device_timestamps.get(address)) is not None:
+            out_timestamps[address] = unix_time - time_diff
+        if address in discovered_device_raw:
+            raw = discovered_device_raw[address]
+            out_raws[address] = None if raw is None else decode_bytes(raw)
+    if len(out_timestamps) != len(discovered_device_timestamps):
+        for address, unix_time in discovered_device_timestamps.items():
+            if (
+                address not in out_timestamps
+                and address not in discovered_device_advertisement_datas
+            ):
+                out_timestamps[address] = unix_time - time_diff
+    if len(out_raws) != len(discovered_device_raw):
+        for address, raw in discovered_device_raw.items():
+            if (
+                address not in out_raws
+                and address not in discovered_device_advertisement_datas
+            ):
+                out_raws[address] = None if raw is None else decode_bytes(raw)
+    return out_advs, out_timestamps, out_raws
+
+
+def _encode_bytes(value: bytes) -> str:
+    """Encode a binary blob for storage."""
+    return b2a_base64(value, newline=False).decode("ascii")
+
+
+BLE_DEVICE_NEW: Final = BLEDevice.__new__
+
+
+def _ble_device_fast(address: str, name: str | None, details: Any) -> BLEDevice:
+    """Construct a BLEDevice without running __init__."""
+    device = BLE_DEVICE_NEW(BLEDevice)
+    device.address = address
+    device.name = name
+    device.details = details
+    return device
+
+
+def _ble_device_init(address: str, name: str | None, details: Any) -> BLEDevice:
+    """Construct a BLEDevice through its __init__."""
+    return BLEDevice(address=address, name=name, details=details)
+
+
+# BLEDevice.__init__ only assigns the three attributes, so skipping it
+# avoids the keyword parsing per deserialized device; probe once at
+# import and fall back in case a future bleak version does more
+try:
+    _ble_device_fast("00:00:00:00:00:00", None, None)
+    _make_ble_device = _ble_device_fast
+except Exception:  # pragma: no cover - depends on bleak internals
+    _make_ble_device = _ble_device_init
+
+
+# Advertisement payloads repeat heavily across devices (identical
+# beacon frames, shared service data), and bytes are immutable, so the
+# decoded blobs can be shared via a cache instead of re-decoded
+
+
+@lru_cache(maxsize=4096)
+def _cached_a2b_base64(value: str) -> bytes:
+    """Decode a base64 storage blob, sharing repeated results."""
+    return a2b_base64(value)
+
+
+@lru_cache(maxsize=4096)
+def _cached_bytes_fromhex(value: str) -> bytes:
+    """Decode a legacy hex storage blob, sharing repeated results."""
+    return bytes.fromhex(value)
+
+
+# Bluetooth SIG company ids are a small bounded universe, so the
+# int<->str conversions repeat constantly across devices; memoize them
+
+
+@lru_cache(maxsize=4096)
+def _manufacturer_id_to_str(manufacturer_id: int) -> str:
+    """Return the storage key for a manufacturer id."""
+    return str(manufacturer_id)
+
+
+@lru_cache(maxsize=4096)
+def _manufacturer_id_from_str(manufacturer_id: str) -> int:
+    """Return the manufacturer id for a storage key."""
+    return int(manufacturer_id)
+
+
+def _discovered_device_from_dict(
+    device_advertisement_data: DiscoveredDeviceDict,
+    decode_bytes: Callable[[str], bytes],
+) -> tuple[BLEDevice, AdvertisementData]:
+    """Deserialize one discovered device and its advertisement in one pass."""
+    # Build the kwargs explicitly instead of copying the stored dict
+    # and popping the legacy rssi key (dropped from BLEDevice in
+    # bleak 1.x); old dicts that still carry rssi are simply ignored
+    device_dict = device_advertisement_data[DEVICE]
+    advertisement_data = device_advertisement_data[ADVERTISEMENT_DATA]
+    # Data loaded from JSON is a list, but data that round-trips
+    # in memory may already carry the original tuple
+    platform_data: list[Any] | tuple[Any, ...] = advertisement_data[PLATFORM_DATA]
+    return (
+        _make_ble_device(
+            device_dict[ADDRESS],
+            device_dict.get(NAME),
+            device_dict.get(DETAILS),
+        ),
+        AdvertisementData(
+            local_name=advertisement_data[LOCAL_NAME],
+            manufacturer_data={
+                _manufacturer_id_from_str(manufacturer_id): decode_bytes(
+                    manufacturer_data
+                )
+                for manufacturer_id, manufacturer_data in advertisement_data[
+                    MANUFACTURER_DATA
+                ].items()
+            },
+            service_data={
+                service_uuid: decode_bytes(service_data)
+                for service_uuid, service_data in advertisement_data[
+                    SERVICE_DATA
+                ].items()
+            },
+            service_uuids=advertisement_data[SERVICE_UUIDS],
+            rssi=advertisement_data[RSSI],
+            tx_power=advertisement_data[TX_POWER],
+            # Skip the copy when the loaded data is already a tuple
+            platform_data=(
+                platform_data if type(platform_data) is tuple else tuple(platform_data)
+            ),
+        ),
     )
 
 
-def _advertisement_data_to_dict(
-    advertisement_data: AdvertisementData,
-) -> AdvertisementDataDict:
-    """Serialize advertisement_data."""
-    return AdvertisementDataDict(
-        local_name=advertisement_data.local_name,
-        manufacturer_data={
-            str(manufacturer_id): manufacturer_data.hex()
-            for manufacturer_id, manufacturer_data in advertisement_data.manufacturer_data.items()  # noqa: E501
+def _discovered_device_to_dict(
+    ble_device: BLEDevice, advertisement_data: AdvertisementData
+) -> DiscoveredDeviceDict:
+    """Serialize one discovered device and its advertisement in one pass."""
+    # Hoist the attribute loads out of the comprehensions
+    rssi = advertisement_data.rssi
+    manufacturer_datas = advertisement_data.manufacturer_data
+    service_datas = advertisement_data.service_data
+    platform_data: list[Any] | tuple[Any, ...] = advertisement_data.platform_data
+    return {
+        DEVICE: {
+            ADDRESS: ble_device.address,
+            NAME: ble_device.name,
+            RSSI: rssi,  # For backward compatibility
+            DETAILS: ble_device.details,
         },
-        service_data={
-            service_uuid: service_data.hex()
-            for service_uuid, service_data in advertisement_data.service_data.items()
+        ADVERTISEMENT_DATA: {
+            LOCAL_NAME: advertisement_data.local_name,
+            MANUFACTURER_DATA: {
+                _manufacturer_id_to_str(manufacturer_id): _encode_bytes(
+                    manufacturer_data
+                )
+                for manufacturer_id, manufacturer_data in manufacturer_datas.items()
+            },
+            SERVICE_DATA: {
+                service_uuid: _encode_bytes(service_data)
+                for service_uuid, service_data in service_datas.items()
+            },
+            SERVICE_UUIDS: advertisement_data.service_uuids,
+            RSSI: rssi,
+            TX_POWER: advertisement_data.tx_power,
+            # Skip the copy when the data is already a list
+            PLATFORM_DATA: (
+                platform_data if type(platform_data) is list else list(platform_data)
+            ),
         },
-        service_uuids=advertisement_data.service_uuids,
-        rssi=advertisement_data.rssi,
-        tx_power=advertisement_data.tx_power,
-        platform_data=list(advertisement_data.platform_data),
-    )
-
-
-def _get_monotonic_time_diff() -> float:
-    """Get monotonic time diff."""
-    return time.time() - time.monotonic()
-
-
-def _deserialize_discovered_device_timestamps(
-    discovered_device_timestamps: dict[str, float],
-) -> dict[str, float]:
-    """Deserialize discovered_device_timestamps."""
-    time_diff = _get_monotonic_time_diff()
-    return {
-        address: unix_time - time_diff
-        for address, unix_time in discovered_device_timestamps.items()
-    }
-
-
-def _serialize_discovered_device_timestamps(
-    discovered_device_timestamps: dict[str, float],
-) -> dict[str, float]:
-    """Serialize discovered_device_timestamps."""
-    time_diff = _get_monotonic_time_diff()
-    return {
-        address: monotonic_time + time_diff
-        for address, monotonic_time in discovered_device_timestamps.items()
     }
 
 
-def _deserialize_discovered_device_raw(
-    discovered_device_raw: dict[str, str | None],
-) -> dict[str, bytes | None]:
-    """Deserialize discovered_device_timestamps."""
-    return {
-        address: None if raw is None else bytes.fromhex(raw)
-        for address, raw in discovered_device_raw.items()
-    }
+# [wall clock time, wall - monotonic diff] of the last refresh
+_MONOTONIC_TIME_DIFF_CACHE: Final[list[float]] = [0.0, 0.0]
 
 
-def _serialize_discovered_device_raw(
-    discovered_device_raw: dict[str, bytes | None],
-) -> dict[str, str | None]:
-    """Serialize discovered_device_timestamps."""
-    return {
-        address: None if raw is None else raw.hex()
-        for address, raw in discovered_device_raw.items()
-    }
+def _get_monotonic_time_diff() -> float:
+    """
+    Get monotonic time diff.
+
+    The diff is cached for up to a second so scanners deserializing
+    back-to-back on startup do not pay two clock reads each; the
+    resulting <=1s slop is negligible against expire_seconds.
+    """
+    cache = _MONOTONIC_TIME_DIFF_CACHE
+    now = time.time()
+    if now - cache[0] >= 1.0:
+        cache[0] = now
+        cache[1] = now - time.monotonic()
+    return cache[1]
 
 
 DiscoveryStorageType = dict[str, DiscoveredDeviceAdvertisementDataDict]
@@ -0,0 +1,254 @@
+"""Binary serialization for bluetooth adapter discoveries."""
+
+from __future__ import annotations
+
+import json
+import logging
+from functools import lru_cache
+from struct import Struct
+from typing import Any, Final
+
+from bleak.backends.device import BLEDevice
+from bleak.backends.scanner import AdvertisementData
+
+from .storage import (
+    DiscoveredDeviceAdvertisementData,
+    _get_monotonic_time_diff,
+    _make_ble_device,
+    loads_storage,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+MAGIC: Final = b"HABT"
+FORMAT_VERSION: Final = 1
+
+# magic, format version, connectable, expire_seconds, device count
+_HEADER: Final = Struct("<4sB?dI")
+# monotonic timestamp, rssi, tx_power (sentinel for None)
+_DEVICE_FIXED: Final = Struct("<dhh")
+_U16: Final = Struct("<H")
+_U32: Final = Struct("<I")
+
+_NO_TX_POWER: Final = -32768
+# Length sentinel for None blobs/strings
+_NONE_LENGTH: Final = 0xFFFFFFFF
+# Length sentinel for an address packed as 6 raw MAC bytes
+_MAC_LENGTH: Final = 0xFFFFFFFE
+
+
+@lru_cache(maxsize=1024)
+def _mac_to_bytes(address: str) -> bytes | None:
+    """Pack AA:BB:CC:DD:EE:FF into 6 raw bytes, or None if not a MAC."""
+    if len(address) != 17:
+        return None
+    try:
+        packed = bytes.fromhex(address.replace(":", ""))
+    except ValueError:
+        return None
+    # Only use the packed form when it round-trips exactly; macOS
+    # UUID addresses and unusual casings take the string path
+    if packed.hex(":").upper() == address:
+        return packed
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _mac_from_bytes(packed: bytes) -> str:
+    """Expand 6 raw MAC bytes back to AA:BB:CC:DD:EE:FF."""
+    return packed.hex(":").upper()
+
+
+def _write_bytes(buf: bytearray, value: bytes | None) -> None:
+    """Append a length-prefixed blob, using the sentinel for None."""
+    if value is None:
+        buf += _U32.pack(_NONE_LENGTH)
+    else:
+        buf += _U32.pack(len(value))
+        buf += value
+
+
+def _write_str(buf: bytearray, value: str | None) -> None:
+    """Append a length-prefixed UTF-8 string."""
+    _write_bytes(buf, None if value is None else value.encode())
+
+
+def _write_json(buf: bytearray, value: Any) -> None:
+    """Append a length-prefixed JSON blob for free-form data."""
+    _write_bytes(buf, json.dumps(value, separators=(",", ":")).encode())
+
+
+def _write_address(buf: bytearray, address: str) -> None:
+    """Append an address, packed to 6 bytes when it is a MAC."""
+    if (packed := _mac_to_bytes(address)) is not None:
+        buf += _U32.pack(_MAC_LENGTH)
+        buf += packed
+    else:
+        _write_str(buf, address)
+
+
+def _read_address(view: memoryview, pos: int) -> tuple[str, int]:
+    """Read an address written by _write_address."""
+    (length,) = _U32.unpack_from(view, pos)
+    pos += 4
+    if length == _MAC_LENGTH:
+        return _mac_from_bytes(bytes(view[pos : pos + 6])), pos + 6
+    if length == _NONE_LENGTH:
+        raise ValueError("Address missing in binary storage")
+    return str(view[pos : pos + length], "utf-8"), pos + length
+
+
+def _read_bytes(view: memoryview, pos: int) -> tuple[bytes | None, int]:
+    """Read a length-prefixed blob, returning (value, new position)."""
+    (length,) = _U32.unpack_from(view, pos)
+    pos += 4
+    if length == _NONE_LENGTH:
+        return None, pos
+    return bytes(view[pos : pos + length]), pos + length
+
+
+def _read_str(view: memoryview, pos: int) -> tuple[str | None, int]:
+    """Read a length-prefixed UTF-8 string."""
+    value, pos = _read_bytes(view, pos)
+    return (None if value is None else value.decode()), pos
+
+
+def _read_json(view: memoryview, pos: int) -> tuple[Any, int]:
+    """Read a length-prefixed JSON blob."""
+    value, pos = _read_bytes(view, pos)
+    if value is None:
+        return None, pos
+    return json.loads(value), pos
+
+
+def pack(data: DiscoveredDeviceAdvertisementData) -> bytes:
+    """
+    Serialize discovered device advertisement data to a binary blob.
+
+    Stores raw bytes instead of base64/hex text and no dict keys,
+    which is several times smaller than the JSON form. The JSON path
+    remains the on-disk compatibility format; unpack falls back to it
+    when the magic prefix is missing.
+    """
+    discovered = data.discovered_device_advertisement_datas
+    timestamps = data.discovered_device_timestamps
+    raws = data.discovered_device_raw
+    time_diff = _get_monotonic_time_diff()
+    buf = bytearray(
+        _HEADER.pack(
+            MAGIC,
+            FORMAT_VERSION,
+            data.connectable,
+            data.expire_seconds,
+            len(discovered),
+        )
+    )
+    for address, (device, advertisement_data) in discovered.items():
+        _write_address(buf, address)
+        tx_power = advertisement_data.tx_power
+        buf += _DEVICE_FIXED.pack(
+            timestamps.get(address, 0.0) + time_diff,
+            advertisement_data.rssi,
+            _NO_TX_POWER if tx_power is None else tx_power,
+        )
+        _write_str(buf, device.name)
+        _write_json(buf, device.details)
+        _write_str(buf, advertisement_data.local_name)
+        manufacturer_datas = advertisement_data.manufacturer_data
+        buf += _U16.pack(len(manufacturer_datas))
+        for manufacturer_id, manufacturer_data in manufacturer_datas.items():
+            buf += _U32.pack(manufacturer_id)
+            _write_bytes(buf, manufacturer_data)
+        service_datas = advertisement_data.service_data
+        buf += _U16.pack(len(service_datas))
+        for service_uuid, service_data in service_datas.items():
+            _write_str(buf, service_uuid)
+            _write_bytes(buf, service_data)
+        service_uuids = advertisement_data.service_uuids
+        buf += _U16.pack(len(service_uuids))
+        for service_uuid in service_uuids:
+            _write_str(buf, service_uuid)
+        _write_json(buf, list(advertisement_data.platform_data))
+        _write_bytes(buf, raws.get(address))
+    return bytes(buf)
+
+
+def unpack(buf: bytes) -> DiscoveredDeviceAdvertisementData | None:
+    """
+    Deserialize discovered device advertisement data from a binary blob.
+
+    Payloads without the magic prefix are treated as legacy JSON and
+    routed through loads_storage.
+    """
+    try:
+        if buf[:4] != MAGIC:
+            return loads_storage(buf)
+        return _unpack(buf)
+    except Exception as err:  # pylint: disable=broad-except
+        _LOGGER.exception(
+            "Error unpacking discovered_device_advertisement_data"
+            ", adapter startup will be slow: %s",
+            err,
+        )
+    return None
+
+
+def _unpack(buf: bytes) -> DiscoveredDeviceAdvertisementData:
+    """Unpack a binary blob with a verified magic prefix."""
+    _, version, connectable, expire_seconds, count = _HEADER.unpack_from(buf, 0)
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported binary storage version: {version}")
+    view = memoryview(buf)
+    pos = _HEADER.size
+    time_diff = _get_monotonic_time_diff()
+    discovered: dict[str, tuple[BLEDevice, AdvertisementData]] = {}
+    timestamps: dict[str, float] = {}
+    raws: dict[str, bytes | None] = {}
+    for _ in range(count):
+        address, pos = _read_address(view, pos)
+        unix_time, rssi, tx_power = _DEVICE_FIXED.unpack_from(view, pos)
+        pos += _DEVICE_FIXED.size
+        name, pos = _read_str(view, pos)
+        details, pos = _read_json(view, pos)
+        local_name, pos = _read_str(view, pos)
+        (manufacturer_count,) = _U16.unpack_from(view, pos)
+        pos += 2
+        manufacturer_datas: dict[int, bytes] = {}
+        for _ in range(manufacturer_count):
+            (manufacturer_id,) = _U32.unpack_from(view, pos)
+            pos += 4
+            manufacturer_data, pos = _read_bytes(view, pos)
+            manufacturer_datas[manufacturer_id] = manufacturer_data  # type: ignore[assignment]
+        (service_data_count,) = _U16.unpack_from(view, pos)
+        pos += 2
+        service_datas: dict[str, bytes] = {}
+        for _ in range(service_data_count):
+            service_uuid, pos = _read_str(view, pos)
+            service_data, pos = _read_bytes(view, pos)
+            service_datas[service_uuid] = service_data  # type: ignore[assignment,index]
+        (service_uuid_count,) = _U16.unpack_from(view, pos)
+        pos += 2
+        service_uuids: list[str] = []
+        for _ in range(service_uuid_count):
+            service_uuid, pos = _read_str(view, pos)
+            service_uuids.append(service_uuid)  # type: ignore[arg-type]
+        platform_data, pos = _read_json(view, pos)
+        raw, pos = _read_bytes(view, pos)
+        discovered[address] = (
+            _make_ble_device(address, name, details),
+            AdvertisementData(
+                local_name=local_name,
+                manufacturer_data=manufacturer_datas,
+                service_data=service_datas,
+                service_uuids=service_uuids,
+                rssi=rssi,
+                tx_power=None if tx_power == _NO_TX_POWER else tx_power,
+                platform_data=tuple(platform_data),
+            ),
+        )
+        timestamps[address] = unix_time - time_diff
+        if raw is not None:
+            raws[address] = raw
+    return DiscoveredDeviceAdvertisementData(
+        connectable, expire_seconds, discovered, timestamps, raws
+    )
@@ -384,6 +384,79 @@ async def test_remote_scanner_expires_non_connectable() -> None:
     unsetup()
 
 
+@pytest.mark.usefixtures("enable_bluetooth")
+@pytest.mark.asyncio
+async def test_remote_scanner_expires_only_stale_devices() -> None:
+    """Test the expire loop stops at the first fresh device."""
+    manager = get_manager()
+
+    old_device = generate_ble_device("44:44:33:11:23:45", "old", {}, rssi=-100)
+    old_device_adv = generate_advertisement_data(
+        local_name="old",
+        service_uuids=[],
+        manufacturer_data={1: b"\x01"},
+        rssi=-100,
+    )
+    fresh_device = generate_ble_device("44:44:33:11:23:46", "fresh", {}, rssi=-100)
+    fresh_device_adv = generate_advertisement_data(
+        local_name="fresh",
+        service_uuids=[],
+        manufacturer_data={1: b"\x01"},
+        rssi=-100,
+    )
+    freshest_device = generate_ble_device(
+        "44:44:33:11:23:47", "freshest", {}, rssi=-100
+    )
+    freshest_device_adv = generate_advertisement_data(
+        local_name="freshest",
+        service_uuids=[],
+        manufacturer_data={1: b"\x01"},
+        rssi=-100,
+    )
+
+    connector = HaBluetoothConnector(
+        MockBleakClient, "mock_bleak_client", lambda: False
+    )
+    scanner = FakeScanner("esp32", "esp32", connector, True)
+    unsetup = scanner.async_setup()
+    cancel = manager.async_register_scanner(scanner)
+
+    start_time_monotonic = time.monotonic()
+    expire_monotonic = (
+        start_time_monotonic
+        + CONNECTABLE_FALLBACK_MAXIMUM_STALE_ADVERTISEMENT_SECONDS
+        + 1
+    )
+    scanner.inject_advertisement(old_device, old_device_adv, start_time_monotonic)
+    # The fresh devices are detected just before expiry fires, so the
+    # expire loop must stop at the first fresh entry and never visit
+    # the freshest one behind it
+    scanner.inject_advertisement(fresh_device, fresh_device_adv, expire_monotonic - 2)
+    scanner.inject_advertisement(
+        freshest_device, freshest_device_adv, expire_monotonic - 1
+    )
+    assert len(scanner.discovered_devices) == 3
+
+    expire_utc = utcnow() + timedelta(
+        seconds=CONNECTABLE_FALLBACK_MAXIMUM_STALE_ADVERTISEMENT_SECONDS + 1
+    )
+    with patch_bluetooth_time(expire_monotonic):
+        async_fire_time_changed(expire_utc)
+        await asyncio.sleep(0)
+
+    # Only the stale device is dropped and the detection-time index
+    # stays consistent with the service info cache
+    assert {device.address for device in scanner.discovered_devices} == {
+        fresh_device.address,
+        freshest_device.address,
+    }
+    assert list(scanner._by_time) == [fresh_device.address, freshest_device.address]
+    assert set(scanner._by_time) == set(scanner._previous_service_info)
+
+    cancel()
+    unsetup()
+
+
 @pytest.mark.usefixtures("enable_bluetooth")
 @pytest.mark.asyncio
 async def test_base_scanner_connecting_behavior() -> None:
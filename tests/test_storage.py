@@ -10,7 +10,9 @@ from habluetooth.storage import (
     DiscoveredDeviceAdvertisementDataDict,
     discovered_device_advertisement_data_from_dict,
     discovered_device_advertisement_data_to_dict,
+    dumps_storage,
     expire_stale_scanner_discovered_device_advertisement_data,
+    loads_storage,
 )
 
 
@@ -44,15 +46,16 @@ def test_discovered_device_advertisement_data_to_dict():
         )
     )
     assert result == {
+        "version": 2,
         "connectable": True,
         "discovered_device_advertisement_datas": {
             "AA:BB:CC:DD:EE:FF": {
                 "advertisement_data": {
                     "local_name": "Test Device",
-                    "manufacturer_data": {"76": "0215aabbccddeeff"},
+                    "manufacturer_data": {"76": "AhWqu8zd7v8="},
                     "rssi": -50,
                     "service_data": {
-                        "0000180d-0000-1000-8000-00805f9b34fb": "00000000"
+                        "0000180d-0000-1000-8000-00805f9b34fb": "AAAAAA=="
                     },
                     "service_uuids": ["0000180d-0000-1000-8000-00805f9b34fb"],
                     "tx_power": 50,
@@ -150,6 +153,99 @@ def test_discovered_device_advertisement_data_from_dict():
     )
 
 
+def test_discovered_device_advertisement_data_round_trip():
+    """Test a version 2 (base64) dict round trips through to_dict/from_dict."""
+    data = DiscoveredDeviceAdvertisementData(
+        True,
+        100,
+        {
+            "AA:BB:CC:DD:EE:FF": (
+                BLEDevice(
+                    address="AA:BB:CC:DD:EE:FF",
+                    name="Test Device",
+                    details={"details": "test"},
+                ),
+                AdvertisementData(
+                    local_name="Test Device",
+                    manufacturer_data={0x004C: b"\x02\x15\xaa\xbb\xcc\xdd\xee\xff"},
+                    tx_power=50,
+                    service_data={
+                        "0000180d-0000-1000-8000-00805f9b34fb": b"\x00\x00\x00\x00"
+                    },
+                    service_uuids=["0000180d-0000-1000-8000-00805f9b34fb"],
+                    platform_data=("Test Device", ""),
+                    rssi=-50,
+                ),
+            )
+        },
+        {"AA:BB:CC:DD:EE:FF": 100000},
+        {"AA:BB:CC:DD:EE:FF": b"\x02\x15\xaa\xbb\xcc\xdd\xee\xff"},
+    )
+    as_dict = discovered_device_advertisement_data_to_dict(data)
+    assert as_dict["version"] == 2
+    result = discovered_device_advertisement_data_from_dict(as_dict)
+    assert result is not None
+    ble_device, adv_data = result.discovered_device_advertisement_datas[
+        "AA:BB:CC:DD:EE:FF"
+    ]
+    assert ble_device.address == "AA:BB:CC:DD:EE:FF"
+    assert adv_data.manufacturer_data == {0x004C: b"\x02\x15\xaa\xbb\xcc\xdd\xee\xff"}
+    assert adv_data.service_data == {
+        "0000180d-0000-1000-8000-00805f9b34fb": b"\x00\x00\x00\x00"
+    }
+    assert result.discovered_device_raw == {
+        "AA:BB:CC:DD:EE:FF": b"\x02\x15\xaa\xbb\xcc\xdd\xee\xff"
+    }
+
+
+def test_dumps_loads_storage_round_trip():
+    """Test dumps_storage/loads_storage round trips through JSON."""
+    data = DiscoveredDeviceAdvertisementData(
+        True,
+        100,
+        {
+            "AA:BB:CC:DD:EE:FF": (
+                BLEDevice(
+                    address="AA:BB:CC:DD:EE:FF",
+                    name="Test Device",
+                    details={"details": "test"},
+                ),
+                AdvertisementData(
+                    local_name="Test Device",
+                    manufacturer_data={0x004C: b"\x02\x15\xaa\xbb\xcc\xdd\xee\xff"},
+                    tx_power=50,
+                    service_data={
+                        "0000180d-0000-1000-8000-00805f9b34fb": b"\x00\x00\x00\x00"
+                    },
+                    service_uuids=["0000180d-0000-1000-8000-00805f9b34fb"],
+                    platform_data=("Test Device", ""),
+                    rssi=-50,
+                ),
+            )
+        },
+        {"AA:BB:CC:DD:EE:FF": 100000},
+        {"AA:BB:CC:DD:EE:FF": b"\x02\x15\xaa\xbb\xcc\xdd\xee\xff"},
+    )
+    buf = dumps_storage(data)
+    assert isinstance(buf, bytes)
+    result = loads_storage(buf)
+    assert result is not None
+    ble_device, adv_data = result.discovered_device_advertisement_datas[
+        "AA:BB:CC:DD:EE:FF"
+    ]
+    assert ble_device.address == "AA:BB:CC:DD:EE:FF"
+    assert adv_data.manufacturer_data == {0x004C: b"\x02\x15\xaa\xbb\xcc\xdd\xee\xff"}
+    assert result.discovered_device_raw == {
+        "AA:BB:CC:DD:EE:FF": b"\x02\x15\xaa\xbb\xcc\xdd\xee\xff"
+    }
+
+
+def test_loads_storage_corrupt_returns_none(caplog):
+    """Test loads_storage returns None for undecodable bytes."""
+    assert loads_storage(b"not json") is None
+    assert "Error parsing discovered_device_advertisement_data" in caplog.text
+
+
 def test_expire_stale_scanner_discovered_device_advertisement_data():
     """Test expire_stale_scanner_discovered_device_advertisement_data."""
     now = time.time()
@@ -337,8 +433,71 @@ def test_expire_future_discovered_device_advertisement_data(
     )
 
 
+def test_expire_all_fresh_discovered_device_advertisement_data():
+    """Test an all-fresh scanner is retained untouched via the min/max prepass."""
+    now = time.time()
+    data = {
+        "myscanner": DiscoveredDeviceAdvertisementDataDict(
+            {
+                "connectable": True,
+                "discovered_device_advertisement_datas": {
+                    "AA:BB:CC:DD:EE:FF": {
+                        "advertisement_data": {
+                            "local_name": "Test Device",
+                            "manufacturer_data": {"76": "0215aabbccddeeff"},
+                            "rssi": -50,
+                            "service_data": {
+                                "0000180d-0000-1000-8000-00805f9b34fb": "00000000"
+                            },
+                            "service_uuids": ["0000180d-0000-1000-8000-00805f9b34fb"],
+                            "tx_power": 50,
+                            "platform_data": ["Test Device", ""],
+                        },
+                        "device": {
+                            "address": "AA:BB:CC:DD:EE:FF",
+                            "details": {"details": "test"},
+                            "name": "Test Device",
+                        },  # type: ignore[typeddict-item]
+                    },
+                    "CC:DD:EE:FF:AA:BB": {
+                        "advertisement_data": {
+                            "local_name": "Test Device Fresh",
+                            "manufacturer_data": {"76": "0215aabbccddeeff"},
+                            "rssi": -50,
+                            "service_data": {
+                                "0000180d-0000-1000-8000-00805f9b34fb": "00000000"
+                            },
+                            "service_uuids": ["0000180d-0000-1000-8000-00805f9b34fb"],
+                            "tx_power": 50,
+                            "platform_data": ["Test Device", ""],
+                        },
+                        "device": {
+                            "address": "CC:DD:EE:FF:AA:BB",
+                            "details": {"details": "test"},
+                            "name": "Test Device Fresh",
+                        },  # type: ignore[typeddict-item]
+                    },
+                },
+                "discovered_device_raw": {},
+                "discovered_device_timestamps": {
+                    "AA:BB:CC:DD:EE:FF": now,
+                    "CC:DD:EE:FF:AA:BB": now - 50,
+                },
+                "expire_seconds": 100,
+            }
+        ),
+    }
+    expire_stale_scanner_discovered_device_advertisement_data(data)
+    assert "myscanner" in data
+    assert len(data["myscanner"]["discovered_device_advertisement_datas"]) == 2
+    assert data["myscanner"]["discovered_device_timestamps"] == {
+        "AA:BB:CC:DD:EE:FF": now,
+        "CC:DD:EE:FF:AA:BB": now - 50,
+    }
+
+
 def test_discovered_device_advertisement_data_from_dict_corrupt(caplog):
-    """Test discovered_device_advertisement_data_from_dict with corrupt data."""
+    """Test a corrupt entry is dropped without losing the scanner cache."""
     now = time.time()
     result = discovered_device_advertisement_data_from_dict(
         {
@@ -357,13 +516,64 @@ def test_discovered_device_advertisement_data_from_dict_corrupt(caplog):
                         "address": "AA:BB:CC:DD:EE:FF",
                         "details": {"details": "test"},
                     },
-                }
+                },
+                "CC:DD:EE:FF:AA:BB": {
+                    "advertisement_data": {
+                        "local_name": "Good Device",
+                        "manufacturer_data": {"76": "0215aabbccddeeff"},
+                        "rssi": -50,
+                        "service_data": {
+                            "0000180d-0000-1000-8000-00805f9b34fb": "00000000"
+                        },
+                        "service_uuids": ["0000180d-0000-1000-8000-00805f9b34fb"],
+                        "tx_power": 50,
+                        "platform_data": ["Good Device", ""],
+                    },
+                    "device": {
+                        "address": "CC:DD:EE:FF:AA:BB",
+                        "details": {"details": "test"},
+                        "name": "Good Device",
+                    },  # type: ignore[typeddict-item]
+                },
+            },
+            "discovered_device_timestamps": {
+                "AA:BB:CC:DD:EE:FF": now,
+                "CC:DD:EE:FF:AA:BB": now,
             },
-            "discovered_device_timestamps": {"AA:BB:CC:DD:EE:FF": now},
             "expire_seconds": 100,
+            "discovered_device_raw": {
+                "AA:BB:CC:DD:EE:FF": "0215aabbccddeeff",
+                "CC:DD:EE:FF:AA:BB": "0215aabbccddeeff",
+            },
         }
     )
-    assert result is None
+    # The corrupt entry is skipped but the good entry survives; its
+    # timestamp and raw data go with it so the dangling address cannot
+    # round-trip back to disk
+    assert result is not None
+    assert "AA:BB:CC:DD:EE:FF" not in result.discovered_device_advertisement_datas
+    assert "AA:BB:CC:DD:EE:FF" not in result.discovered_device_timestamps
+    assert "AA:BB:CC:DD:EE:FF" not in result.discovered_device_raw
+    assert "CC:DD:EE:FF:AA:BB" in result.discovered_device_advertisement_datas
+    assert "CC:DD:EE:FF:AA:BB" in result.discovered_device_timestamps
+    assert "CC:DD:EE:FF:AA:BB" in result.discovered_device_raw
+    assert "Error deserializing discovered device AA:BB:CC:DD:EE:FF" in caplog.text
+
+
+def test_discovered_device_advertisement_data_from_dict_corrupt_payload(caplog):
+    """Test a corrupt payload returns None instead of raising."""
+    assert (
+        discovered_device_advertisement_data_from_dict(
+            [1, 2, 3]  # type: ignore[arg-type]
+        )
+        is None
+    )
+    assert (
+        discovered_device_advertisement_data_from_dict(
+            {"version": "2"}  # type: ignore[typeddict-item]
+        )
+        is None
+    )
     assert "Error deserializing discovered_device_advertisement_data" in caplog.text
 
 
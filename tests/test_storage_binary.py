@@ -0,0 +1,124 @@
+import pytest
+from bleak.backends.device import BLEDevice
+from bleak.backends.scanner import AdvertisementData
+
+from habluetooth.storage import DiscoveredDeviceAdvertisementData, dumps_storage
+from habluetooth.storage_binary import MAGIC, pack, unpack
+
+
+def _make_data() -> DiscoveredDeviceAdvertisementData:
+    return DiscoveredDeviceAdvertisementData(
+        True,
+        100,
+        {
+            "AA:BB:CC:DD:EE:FF": (
+                BLEDevice(
+                    address="AA:BB:CC:DD:EE:FF",
+                    name="Test Device",
+                    details={"details": "test"},
+                ),
+                AdvertisementData(
+                    local_name="Test Device",
+                    manufacturer_data={0x004C: b"\x02\x15\xaa\xbb\xcc\xdd\xee\xff"},
+                    tx_power=50,
+                    service_data={
+                        "0000180d-0000-1000-8000-00805f9b34fb": b"\x00\x00\x00\x00"
+                    },
+                    service_uuids=["0000180d-0000-1000-8000-00805f9b34fb"],
+                    platform_data=("Test Device", ""),
+                    rssi=-50,
+                ),
+            )
+        },
+        {"AA:BB:CC:DD:EE:FF": 100000},
+        {"AA:BB:CC:DD:EE:FF": b"\x02\x15\xaa\xbb\xcc\xdd\xee\xff"},
+    )
+
+
+def test_pack_unpack_round_trip():
+    """Test pack/unpack round trips the discovered devices."""
+    data = _make_data()
+    buf = pack(data)
+    assert buf.startswith(MAGIC)
+    result = unpack(buf)
+    assert result is not None
+    assert result.connectable is True
+    assert result.expire_seconds == 100
+    ble_device, adv_data = result.discovered_device_advertisement_datas[
+        "AA:BB:CC:DD:EE:FF"
+    ]
+    assert ble_device.address == "AA:BB:CC:DD:EE:FF"
+    assert ble_device.name == "Test Device"
+    assert ble_device.details == {"details": "test"}
+    assert adv_data.local_name == "Test Device"
+    assert adv_data.manufacturer_data == {0x004C: b"\x02\x15\xaa\xbb\xcc\xdd\xee\xff"}
+    assert adv_data.service_data == {
+        "0000180d-0000-1000-8000-00805f9b34fb": b"\x00\x00\x00\x00"
+    }
+    assert adv_data.service_uuids == ["0000180d-0000-1000-8000-00805f9b34fb"]
+    assert adv_data.rssi == -50
+    assert adv_data.tx_power == 50
+    assert adv_data.platform_data == ("Test Device", "")
+    assert result.discovered_device_timestamps["AA:BB:CC:DD:EE:FF"] == pytest.approx(
+        100000, abs=1.5
+    )
+    assert result.discovered_device_raw == {
+        "AA:BB:CC:DD:EE:FF": b"\x02\x15\xaa\xbb\xcc\xdd\xee\xff"
+    }
+
+
+def test_pack_is_smaller_than_json():
+    """Test the binary form is smaller than the JSON form."""
+    data = _make_data()
+    assert len(pack(data)) < len(dumps_storage(data))
+
+
+def test_unpack_legacy_json_fallback():
+    """Test unpack falls back to the JSON loader without the magic prefix."""
+    data = _make_data()
+    result = unpack(dumps_storage(data))
+    assert result is not None
+    ble_device, adv_data = result.discovered_device_advertisement_datas[
+        "AA:BB:CC:DD:EE:FF"
+    ]
+    assert ble_device.address == "AA:BB:CC:DD:EE:FF"
+    assert adv_data.manufacturer_data == {0x004C: b"\x02\x15\xaa\xbb\xcc\xdd\xee\xff"}
+
+
+def test_pack_unpack_non_mac_address():
+    """Test a macOS UUID style address takes the string path and round trips."""
+    address = "12345678-1234-1234-1234-123456789abc"
+    data = DiscoveredDeviceAdvertisementData(
+        True,
+        100,
+        {
+            address: (
+                BLEDevice(address=address, name="Test Device", details={}),
+                AdvertisementData(
+                    local_name="Test Device",
+                    manufacturer_data={},
+                    tx_power=None,
+                    service_data={},
+                    service_uuids=[],
+                    platform_data=(),
+                    rssi=-50,
+                ),
+            )
+        },
+        {address: 100000},
+        {},
+    )
+    result = unpack(pack(data))
+    assert result is not None
+    assert address in result.discovered_device_advertisement_datas
+    ble_device, adv_data = result.discovered_device_advertisement_datas[address]
+    assert ble_device.address == address
+    assert adv_data.tx_power is None
+
+
+def test_unpack_corrupt_returns_none(caplog):
+    """Test a corrupt payload returns None for both formats."""
+    buf = pack(_make_data())
+    assert unpack(buf[: len(buf) // 2]) is None
+    assert unpack(b"not json and not binary") is None
+    assert "Error unpacking discovered_device_advertisement_data" in caplog.text